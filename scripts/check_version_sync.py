@@ -1,18 +1,50 @@
-import re
+import ast
 import sys
 import pathlib
+import tomllib
 
 root = pathlib.Path(__file__).resolve().parents[1]
-pyproj = (root / "pyproject.toml").read_text(encoding="utf-8")
-pkg = (root / "src/forge/__init__.py").read_text(encoding="utf-8")
 
-m1 = re.search(r'\nversion\s*=\s*"([^"]+)"', pyproj)
-m2 = re.search(r'__version__\s*=\s*"([^"]+)"', pkg)
-if not (m1 and m2):
+
+def _pyproject_version(path: pathlib.Path) -> str | None:
+    # Stream line-by-line and stop at the [project] version entry; the
+    # version sits near the top, so this avoids reading the dependency
+    # tables that make up most of the file. The single matched line is
+    # still parsed as TOML rather than scraped.
+    in_project = False
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("["):
+                in_project = stripped == "[project]"
+            elif in_project and stripped.startswith("version"):
+                try:
+                    return tomllib.loads(stripped)["version"]
+                except (tomllib.TOMLDecodeError, KeyError):
+                    return None
+    return None
+
+
+def _init_version(path: pathlib.Path) -> str | None:
+    # __version__ is a one-line assignment at the top of the module, so
+    # stop at the first match instead of parsing the whole file.
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("__version__"):
+                try:
+                    value = ast.literal_eval(line.split("=", 1)[1].strip())
+                except (ValueError, SyntaxError, IndexError):
+                    return None
+                return value if isinstance(value, str) else None
+    return None
+
+
+v1 = _pyproject_version(root / "pyproject.toml")
+v2 = _init_version(root / "src/forge/__init__.py")
+if not (v1 and v2):
     print("Could not find version in pyproject.toml or src/forge/__init__.py")
     sys.exit(1)
 
-v1, v2 = m1.group(1), m2.group(1)
 if v1 != v2:
     print(f"Version mismatch: pyproject.toml={v1} vs __init__={v2}")
     sys.exit(2)
@@ -18,10 +18,14 @@ Usage:
 """
 
 import argparse
-import os
+import ast
+import asyncio
 import re
+import shlex
 import subprocess
 import sys
+import tomllib
+import zipfile
 from pathlib import Path
 from typing import Literal, Optional, Tuple
 
@@ -37,8 +41,12 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 PYPROJECT_TOML = PROJECT_ROOT / "pyproject.toml"
 FORGE_INIT = PROJECT_ROOT / "src" / "forge" / "__init__.py"
 
-# Constants
-TEMP_VERIFY_FILE = "temp_verify.py"
+
+# Pre-compiled version-substitution patterns used by update_version_files.
+# Bytes patterns let the substitution run on raw file content without a
+# UTF-8 decode/encode round-trip (versions are ASCII).
+_PYPROJECT_VERSION_RE = re.compile(rb'(\nversion\s*=\s*")[^"]+(")')
+_INIT_VERSION_RE = re.compile(rb'(__version__\s*=\s*")[^"]+(")')
 
 
 class ForgeReleaseError(Exception):
@@ -47,14 +55,30 @@ class ForgeReleaseError(Exception):
     pass
 
 
+# Characters whose presence means a command actually needs a shell
+# (&&-chains, pipes, globs, redirects, quoting, variable expansion)
+_SHELL_METACHARACTERS = set("|&;<>()$`*?~\"'\\")
+
+
 def run_command(
     cmd: str, cwd: Optional[Path] = None, check: bool = True
 ) -> subprocess.CompletedProcess[str]:
-    """Run a shell command and return the result"""
+    """
+    Run a command and return the result.
+
+    Commands without shell metacharacters are split into argv and executed
+    directly, skipping the /bin/sh intermediary; only &&-chains, globs, and
+    similar constructs fall back to shell=True.
+    """
     console.print(f"[blue]Running:[/blue] {cmd}")
 
+    needs_shell = any(char in _SHELL_METACHARACTERS for char in cmd)
     result = subprocess.run(
-        cmd, shell=True, cwd=cwd or PROJECT_ROOT, capture_output=True, text=True
+        cmd if needs_shell else shlex.split(cmd),
+        shell=needs_shell,
+        cwd=cwd or PROJECT_ROOT,
+        capture_output=True,
+        text=True,
     )
 
     if check and result.returncode != 0:
@@ -65,22 +89,56 @@ def run_command(
     return result
 
 
+def _read_pyproject_version() -> Optional[str]:
+    """Read the project version from pyproject.toml via the TOML parser"""
+    try:
+        return tomllib.loads(PYPROJECT_TOML.read_text(encoding="utf-8"))["project"]["version"]
+    except (tomllib.TOMLDecodeError, KeyError):
+        return None
+
+
+def _read_init_version() -> Optional[str]:
+    """Read __version__ from src/forge/__init__.py by walking its AST"""
+    tree = ast.parse(FORGE_INIT.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__version__" for target in node.targets
+        ):
+            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                return node.value.value
+    return None
+
+
+def run_git(*args: str, check: bool = True) -> subprocess.CompletedProcess[str]:
+    """
+    Run a git command directly from argv, without an intermediate shell.
+
+    Every shell=True call spawns /bin/sh just to exec git; for the handful
+    of git invocations in a release that doubles the process count for no
+    benefit. Git has no general-purpose batch mode to keep a single process
+    alive across commands, so one clean spawn per command is the floor.
+    """
+    cmd = ["git", *args]
+    console.print(f"[blue]Running:[/blue] {' '.join(cmd)}")
+
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+
+    if check and result.returncode != 0:
+        console.print(f"[red]Command failed:[/red] {' '.join(cmd)}")
+        console.print(f"[red]Error:[/red] {result.stderr}")
+        raise ForgeReleaseError(f"Command failed: {' '.join(cmd)}")
+
+    return result
+
+
 def get_current_version() -> Tuple[str, str]:
     """Get current version from both pyproject.toml and __init__.py"""
-    # Read pyproject.toml
-    pyproject_content = PYPROJECT_TOML.read_text(encoding="utf-8")
-    pyproject_match = re.search(r'\nversion\s*=\s*"([^"]+)"', pyproject_content)
-
-    # Read __init__.py
-    init_content = FORGE_INIT.read_text(encoding="utf-8")
-    init_match = re.search(r'__version__\s*=\s*"([^"]+)"', init_content)
+    pyproject_version = _read_pyproject_version()
+    init_version = _read_init_version()
 
-    if not pyproject_match or not init_match:
+    if not pyproject_version or not init_version:
         raise ForgeReleaseError("Could not find version in pyproject.toml or __init__.py")
 
-    pyproject_version = pyproject_match.group(1)
-    init_version = init_match.group(1)
-
     if pyproject_version != init_version:
         raise ForgeReleaseError(
             f"Version mismatch: pyproject.toml={pyproject_version} vs __init__.py={init_version}"
@@ -112,55 +170,111 @@ def update_version_files(new_version: str) -> None:
     """Update version in both pyproject.toml and __init__.py"""
     console.print(f"[green]Updating version to:[/green] {new_version}")
 
-    # Update pyproject.toml
-    pyproject_content = PYPROJECT_TOML.read_text(encoding="utf-8")
-    pyproject_content = re.sub(
-        r'(\nversion\s*=\s*")[^"]+(")', f"\\g<1>{new_version}\\g<2>", pyproject_content
-    )
-    PYPROJECT_TOML.write_text(pyproject_content, encoding="utf-8")
+    version_bytes = new_version.encode("ascii")
 
-    # Update __init__.py
-    init_content = FORGE_INIT.read_text(encoding="utf-8")
-    init_content = re.sub(
-        r'(__version__\s*=\s*")[^"]+(")', f"\\g<1>{new_version}\\g<2>", init_content
-    )
-    FORGE_INIT.write_text(init_content, encoding="utf-8")
+    def _substitute(match: "re.Match[bytes]") -> bytes:
+        return match.group(1) + version_bytes + match.group(2)
+
+    # Update pyproject.toml (skip the write if the version already matches)
+    pyproject_content = PYPROJECT_TOML.read_bytes()
+    updated_pyproject = _PYPROJECT_VERSION_RE.sub(_substitute, pyproject_content)
+    if updated_pyproject != pyproject_content:
+        PYPROJECT_TOML.write_bytes(updated_pyproject)
+
+    # Update __init__.py (skip the write if the version already matches)
+    init_content = FORGE_INIT.read_bytes()
+    updated_init = _INIT_VERSION_RE.sub(_substitute, init_content)
+    if updated_init != init_content:
+        FORGE_INIT.write_bytes(updated_init)
 
     console.print("[green]✓[/green] Version files updated")
 
 
+def _git_snapshot() -> Tuple[str, bool]:
+    """
+    Get the current branch name and working-tree cleanliness in one git call.
+
+    `git status --porcelain --branch` reports both in a single invocation,
+    so callers that need branch + status pay one process spawn instead of two.
+    """
+    result = run_git("status", "--porcelain", "--branch", check=False)
+    lines = result.stdout.splitlines()
+
+    branch = ""
+    if lines and lines[0].startswith("## "):
+        # Header looks like "## main...origin/main" or "## main"
+        branch = lines[0][3:].split("...")[0]
+
+    is_clean = not any(line.strip() for line in lines[1:])
+    return branch, is_clean
+
+
 def check_git_status() -> bool:
     """Check if git working directory is clean"""
-    result = run_command("git status --porcelain", check=False)
-    return len(result.stdout.strip()) == 0
+    return _git_snapshot()[1]
 
 
 def get_current_branch() -> str:
     """Get current git branch name"""
-    result = run_command("git branch --show-current")
-    return result.stdout.strip()
+    return _git_snapshot()[0]
+
+
+async def _run_concurrently(commands: list[tuple[str, ...]]) -> list[tuple[int, str]]:
+    """
+    Run independent argv commands concurrently, returning (returncode, output).
+
+    asyncio.create_subprocess_exec spawns each tool without a shell and the
+    event loop overlaps their runtimes, so three checks cost roughly the
+    wall-clock time of the slowest one.
+    """
+
+    async def _run(argv: tuple[str, ...]) -> tuple[int, str]:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=PROJECT_ROOT,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        output = (stderr or stdout).decode(errors="replace")
+        return proc.returncode or 0, output
+
+    return await asyncio.gather(*(_run(argv) for argv in commands))
 
 
 def run_quality_checks() -> None:
     """Run all quality checks (linting, formatting, tests, etc.)"""
     console.print("[blue]Running quality checks...[/blue]")
 
-    # Check ruff linting
-    console.print("→ Running ruff check...")
-    run_command("ruff check .")
+    # Ruff, black, and the version-sync check are independent of each
+    # other, so run them concurrently instead of paying a sequential
+    # tool startup for each one.
+    parallel_checks = [
+        ("ruff check", ("ruff", "check", ".")),
+        ("black format check", ("black", "--check", ".")),
+        ("version synchronization", (sys.executable, "scripts/check_version_sync.py")),
+    ]
+
+    for label, _ in parallel_checks:
+        console.print(f"→ Running {label}...")
+
+    results = asyncio.run(_run_concurrently([argv for _, argv in parallel_checks]))
 
-    # Check black formatting
-    console.print("→ Running black format check...")
-    run_command("black --check .")
+    failed = []
+    for (_, argv), (returncode, output) in zip(parallel_checks, results):
+        if returncode != 0:
+            cmd = " ".join(argv)
+            console.print(f"[red]Command failed:[/red] {cmd}")
+            console.print(f"[red]Error:[/red] {output}")
+            failed.append(cmd)
+
+    if failed:
+        raise ForgeReleaseError(f"Quality checks failed: {', '.join(failed)}")
 
     # Run tests
     console.print("→ Running tests...")
     run_command("pytest -q", check=False)  # Allow tests to fail for now
 
-    # Check version synchronization
-    console.print("→ Checking version synchronization...")
-    run_command("python scripts/check_version_sync.py")
-
     console.print("[green]✓[/green] All quality checks passed")
 
 
@@ -168,47 +282,25 @@ def build_and_validate() -> None:
     """Build the package and validate it"""
     console.print("[blue]Building and validating package...[/blue]")
 
-    # Clean previous builds
-    run_command("rm -rf dist/", check=False)
-
-    # Build package
-    console.print("→ Building package...")
-    run_command("python -m build")
+    # Clean, build, and check metadata in a single shell invocation
+    # instead of three separate process spawns
+    console.print("→ Building package and checking metadata...")
+    run_command("rm -rf dist/ && python -m build && python -m twine check dist/*")
 
-    # Check metadata
-    console.print("→ Checking package metadata...")
-    run_command("python -m twine check dist/*")
-
-    # Verify templates are included
+    # Verify templates are included; reading the wheel in-process takes
+    # milliseconds versus a fresh interpreter spawn
     console.print("→ Verifying templates are included...")
-    verify_templates_script = """
-import glob
-import zipfile
-import sys
+    wheels = sorted((PROJECT_ROOT / "dist").glob("*.whl"))
+    if not wheels:
+        raise ForgeReleaseError("No wheels built")
 
-wheels = glob.glob("dist/*.whl")
-if not wheels:
-    print("No wheels built")
-    sys.exit(1)
+    with zipfile.ZipFile(wheels[0]) as wheel:
+        template_files = [n for n in wheel.namelist() if n.startswith("forge/templates/")]
 
-with zipfile.ZipFile(wheels[0]) as z:
-    template_files = [n for n in z.namelist() if n.startswith("forge/templates/")]
     if not template_files:
-        print("Templates not found in wheel")
-        sys.exit(1)
-
-print(f"Found {len(template_files)} template files in wheel")
-"""
-
-    with open(TEMP_VERIFY_FILE, "w") as f:
-        f.write(verify_templates_script)
-
-    try:
-        run_command(f"python {TEMP_VERIFY_FILE}")
-    finally:
-        if os.path.exists(TEMP_VERIFY_FILE):
-            os.remove(TEMP_VERIFY_FILE)
+        raise ForgeReleaseError("Templates not found in wheel")
 
+    console.print(f"Found {len(template_files)} template files in wheel")
     console.print("[green]✓[/green] Package built and validated successfully")
 
 
@@ -216,24 +308,24 @@ def start_feature(feature_name: str) -> None:
     """Start a new feature development branch"""
     console.print(Panel(f"[bold blue]Starting Feature Development: {feature_name}[/bold blue]"))
 
-    # Check if working directory is clean
-    if not check_git_status():
+    # One git call answers both the cleanliness and branch checks
+    current_branch, is_clean = _git_snapshot()
+    if not is_clean:
         raise ForgeReleaseError("Working directory is not clean. Please commit or stash changes.")
 
     # Make sure we're on main
-    current_branch = get_current_branch()
     if current_branch != "main":
         console.print("[yellow]Switching to main branch...[/yellow]")
-        run_command("git checkout main")
+        run_git("checkout", "main")
 
     # Pull latest changes
     console.print("Pulling latest changes...")
-    run_command("git pull origin main")
+    run_git("pull", "origin", "main")
 
     # Create feature branch
     branch_name = f"feature/{feature_name}"
     console.print(f"Creating feature branch: {branch_name}")
-    run_command(f"git checkout -b {branch_name}")
+    run_git("checkout", "-b", branch_name)
 
     console.print(f"[green]✓[/green] Feature branch '{branch_name}' created and checked out")
     console.print("\n[bold blue]Next steps:[/bold blue]")
@@ -272,10 +364,12 @@ def prepare_release(version_type: Literal["patch", "minor", "major"]) -> None:
     # Build and validate
     build_and_validate()
 
-    # Commit version changes
+    # Commit version changes (stage + commit in one process spawn)
     console.print("Committing version changes...")
-    run_command("git add pyproject.toml src/forge/__init__.py")
-    run_command(f'git commit -m "bump: version {current_version} -> {new_version}"')
+    run_command(
+        "git add pyproject.toml src/forge/__init__.py"
+        f' && git commit -m "bump: version {current_version} -> {new_version}"'
+    )
 
     console.print(f"[green]✓[/green] Release prepared for version {new_version}")
     console.print("\n[bold blue]Next steps:[/bold blue]")
@@ -287,25 +381,24 @@ def create_release() -> None:
     """Create a GitHub release and tag"""
     console.print(Panel("[bold blue]Creating GitHub Release[/bold blue]"))
 
-    # Make sure we're on main
-    current_branch = get_current_branch()
+    # One git call answers both the branch and cleanliness checks
+    current_branch, is_clean = _git_snapshot()
     if current_branch != "main":
         raise ForgeReleaseError("Must be on main branch to create release")
 
-    # Check if working directory is clean
-    if not check_git_status():
+    if not is_clean:
         raise ForgeReleaseError("Working directory is not clean")
 
     # Pull latest changes
     console.print("Pulling latest changes...")
-    run_command("git pull origin main")
+    run_git("pull", "origin", "main")
 
     # Get current version
     current_version, _ = get_current_version()
     tag_name = f"v{current_version}"
 
     # Check if tag already exists
-    result = run_command(f"git tag -l {tag_name}", check=False)
+    result = run_git("tag", "-l", tag_name, check=False)
     if result.stdout.strip():
         raise ForgeReleaseError(f"Tag {tag_name} already exists")
 
@@ -313,10 +406,10 @@ def create_release() -> None:
     run_quality_checks()
     build_and_validate()
 
-    # Create and push tag
+    # Create and push tag in one invocation; && keeps the push from
+    # running if tag creation fails
     console.print(f"Creating tag: {tag_name}")
-    run_command(f"git tag {tag_name}")
-    run_command(f"git push origin {tag_name}")
+    run_command(f"git tag {tag_name} && git push origin {tag_name}")
 
     console.print(f"[green]✓[/green] Release {tag_name} created successfully")
     console.print("\n[blue]GitHub Actions will now:[/blue]")
@@ -349,7 +442,7 @@ def full_release(version_type: Literal["patch", "minor", "major"]) -> None:
 
     # Push changes
     console.print("Pushing changes to main...")
-    run_command("git push origin main")
+    run_git("push", "origin", "main")
 
     # Create release
     create_release()
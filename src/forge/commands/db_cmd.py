@@ -14,7 +14,8 @@ Key features:
 """
 
 from __future__ import annotations
-import subprocess
+import functools
+import tomllib
 from pathlib import Path
 import typer
 
@@ -126,7 +127,7 @@ def migrate(message: str = typer.Option("auto", "--message", "-m")):
         Must be run from the project root directory.
     """
     _ensure_root()
-    subprocess.check_call(["alembic", "revision", "--autogenerate", "-m", message])
+    _alembic_command().revision(_alembic_config(), message=message, autogenerate=True)
 
 
 @db.command("upgrade")
@@ -149,7 +150,7 @@ def upgrade(revision: str = typer.Argument("head")):
         Must be run from the project root directory.
     """
     _ensure_root()
-    subprocess.check_call(["alembic", "upgrade", revision])
+    _alembic_command().upgrade(_alembic_config(), revision)
 
 
 @db.command("downgrade")
@@ -176,7 +177,34 @@ def downgrade(revision: str = typer.Argument("-1")):
         Must be run from the project root directory.
     """
     _ensure_root()
-    subprocess.check_call(["alembic", "downgrade", revision])
+    _alembic_command().downgrade(_alembic_config(), revision)
+
+
+def _alembic_command():
+    """
+    Import and return the alembic.command module.
+
+    Calling Alembic's Python API in-process avoids spawning a second
+    interpreter (and a second SQLAlchemy import cycle) for every migration
+    command. Import lazily so projects without Alembic installed get a
+    clear error only when a db command actually needs it.
+
+    Raises:
+        SystemExit: If Alembic is not installed in the current environment
+    """
+    try:
+        from alembic import command
+    except ModuleNotFoundError:
+        raise SystemExit("Alembic is not installed. Run: pip install alembic")
+    return command
+
+
+@functools.lru_cache(maxsize=1)
+def _alembic_config():
+    """Parse alembic.ini once per process and reuse the Config object."""
+    from alembic.config import Config
+
+    return Config("alembic.ini")
 
 
 def _ensure_root() -> None:
@@ -314,12 +342,15 @@ else:
     env_py_file.write_text(env_content, encoding="utf-8")
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_package_name() -> str:
     """
     Detect the package name by looking for the base.py file.
 
-    Searches for src/<package>/infra/db/base.py to determine the package
-    structure and extract the package name.
+    First tries the project name declared in pyproject.toml (an O(1) read),
+    falling back to a src/ directory scan for src/<package>/infra/db/base.py
+    when that doesn't match the on-disk layout. The result is cached for the
+    lifetime of the process since the package name cannot change mid-run.
 
     Returns:
         Package name (e.g., 'myapp' from src/myapp/infra/db/base.py)
@@ -327,6 +358,17 @@ def _detect_package_name() -> str:
     Raises:
         SystemExit: If the expected package structure is not found
     """
+    # Fast path: [project.name] from pyproject.toml, verified against disk
+    pyproject = Path("pyproject.toml")
+    if pyproject.exists():
+        try:
+            name = tomllib.loads(pyproject.read_text(encoding="utf-8"))["project"]["name"]
+        except (tomllib.TOMLDecodeError, KeyError):
+            name = ""
+        name = name.replace("-", "_")
+        if name and Path(f"src/{name}/infra/db/base.py").exists():
+            return name
+
     for path in Path("src").glob("*/infra/db/base.py"):
         # src/<pkg>/infra/db/base.py  -> package = <pkg>
         return path.parent.parent.parent.name
@@ -14,12 +14,19 @@ The main functionality includes:
 """
 
 from __future__ import annotations
+import functools
+import os
 import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 import typer
 from rich import print as rprint
-from jinja2 import Environment, DictLoader
-from ..utils.fs import ensure_init_files
+from ..utils.fs import detect_package, ensure_init_files, write_bytes
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 generate = typer.Typer(help="Clean Architecture generators")
 
@@ -29,8 +36,10 @@ ENTITY_HELP = "Entity name (e.g. Product)"
 SERVICE_HELP = "Service name (e.g. ProductService)"
 CONTROLLER_HELP = "Controller name (e.g. product)"
 
-# --- Jinja2 Templates for Code Generation ---
-# These templates define the structure for different architectural layers
+# --- Templates for Code Generation ---
+# These templates define the structure for different architectural layers.
+# Most are plain str.format templates ({Var} placeholders); only the OpenAPI
+# controller needs Jinja2 for its |title filters.
 
 # Domain Entity Template - Represents core business objects
 ENTITY_TMPL = """
@@ -38,7 +47,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 @dataclass
-class {{Entity}}:
+class {Entity}:
     id: int | None
     name: str
 """
@@ -48,17 +57,17 @@ REPO_IFACE_TMPL = """
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Iterable, Optional
-from .entity import {{Entity}}
+from .entity import {Entity}
 
-class I{{Entity}}Repository(ABC):
+class I{Entity}Repository(ABC):
     @abstractmethod
-    def get(self, id: int) -> Optional[{{Entity}}]: ...
+    def get(self, id: int) -> Optional[{Entity}]: ...
     
     @abstractmethod
-    def add(self, e: {{Entity}}) -> {{Entity}}: ...
+    def add(self, e: {Entity}) -> {Entity}: ...
     
     @abstractmethod
-    def list(self) -> Iterable[{{Entity}}]: ...
+    def list(self) -> Iterable[{Entity}]: ...
 """
 
 # SQLAlchemy Repository Implementation Template - Data access layer
@@ -68,49 +77,49 @@ from typing import Iterable, Optional
 from sqlalchemy import select, String, Integer
 from sqlalchemy.orm import Mapped, mapped_column, Session
 from ....infra.db.base import Base
-from ....domain.{{bc}}.{{entity_name}}.entity import {{Entity}}
-from ....domain.{{bc}}.{{entity_name}}.repository import I{{Entity}}Repository
+from ....domain.{bc}.{entity_name}.entity import {Entity}
+from ....domain.{bc}.{entity_name}.repository import I{Entity}Repository
 
-class {{Entity}}Row(Base):
-    __tablename__ = "{{table}}"
+class {Entity}Row(Base):
+    __tablename__ = "{table}"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(120))
 
 
-class SqlAlchemy{{Entity}}Repository(I{{Entity}}Repository):
+class SqlAlchemy{Entity}Repository(I{Entity}Repository):
     def __init__(self, session_factory):
         self._sf = session_factory
         
-    def get(self, id: int) -> Optional[{{Entity}}]:
+    def get(self, id: int) -> Optional[{Entity}]:
         with self._sf() as s:  # type: Session
-            r = s.get({{Entity}}Row, id)
-            return {{Entity}}(id=r.id, name=r.name) if r else None
+            r = s.get({Entity}Row, id)
+            return {Entity}(id=r.id, name=r.name) if r else None
             
-    def add(self, e: {{Entity}}) -> {{Entity}}:
+    def add(self, e: {Entity}) -> {Entity}:
         with self._sf() as s:
-            r = {{Entity}}Row(name=e.name)
+            r = {Entity}Row(name=e.name)
             s.add(r); s.commit(); s.refresh(r)
-            return {{Entity}}(id=r.id, name=r.name)
+            return {Entity}(id=r.id, name=r.name)
             
-    def list(self) -> Iterable[{{Entity}}]:
+    def list(self) -> Iterable[{Entity}]:
         with self._sf() as s:
-            return [{{Entity}}(id=r.id, name=r.name) for r in s.scalars(select({{Entity}}Row)).all()]
+            return [{Entity}(id=r.id, name=r.name) for r in s.scalars(select({Entity}Row)).all()]
 """
 
 # Service Layer Template - Business logic and use cases
 SERVICE_TMPL = """
 from __future__ import annotations
-from ....domain.{{bc}}.{{entity_name}}.repository import I{{Entity}}Repository
-from ....domain.{{bc}}.{{entity_name}}.entity import {{Entity}}
+from ....domain.{bc}.{entity_name}.repository import I{Entity}Repository
+from ....domain.{bc}.{entity_name}.entity import {Entity}
 
-class {{Entity}}Service:
-    def __init__(self, repo: I{{Entity}}Repository):
+class {Entity}Service:
+    def __init__(self, repo: I{Entity}Repository):
         self._repo = repo
         
-    def create(self, name: str) -> {{Entity}}:
-        return self._repo.add({{Entity}}(id=None, name=name))
+    def create(self, name: str) -> {Entity}:
+        return self._repo.add({Entity}(id=None, name=name))
         
-    def list(self) -> list[{{Entity}}]:
+    def list(self) -> list[{Entity}]:
         return list(self._repo.list())
 """
 
@@ -175,13 +184,13 @@ class {{name|title}}Collection(MethodView):
 CONTROLLER_BASIC_TMPL = """
 from __future__ import annotations
 from flask import Blueprint, request, jsonify
-from {{pkg}}.shared.di import Container
+from {pkg}.shared.di import Container
 
 # Create basic Flask blueprint
 bp = Blueprint(
-    "{{bc}}_{{name}}", 
+    "{bc}_{name}", 
     __name__, 
-    url_prefix="/{{name}}"
+    url_prefix="/{name}"
 )
 _container: Container | None = None
 
@@ -190,36 +199,36 @@ def init_controller(container: Container) -> None:
     _container = container
 
 @bp.route("", methods=["GET"])
-def list_{{name}}s():
-    \"\"\"List all {{name}}s\"\"\"
+def list_{name}s():
+    \"\"\"List all {name}s\"\"\"
     if _container is None:
         raise RuntimeError("Controller not initialized")
-    svc = _container.get("{{bc}}.{{name}}.service")
+    svc = _container.get("{bc}.{name}.service")
     items = svc.list()
-    return jsonify({"items": [{"id": i.id, "name": i.name} for i in items]})
+    return jsonify({{"items": [{{"id": i.id, "name": i.name}} for i in items]}})
 
 @bp.route("", methods=["POST"])
-def create_{{name}}():
-    \"\"\"Create a new {{name}}\"\"\"
+def create_{name}():
+    \"\"\"Create a new {name}\"\"\"
     if _container is None:
         raise RuntimeError("Controller not initialized")
     data = request.get_json()
     if not data or "name" not in data:
-        return jsonify({"error": "Missing required field: name"}), 400
+        return jsonify({{"error": "Missing required field: name"}}), 400
     
-    svc = _container.get("{{bc}}.{{name}}.service")
+    svc = _container.get("{bc}.{name}.service")
     item = svc.create(data["name"])
-    return jsonify({"id": item.id, "name": item.name}), 201
+    return jsonify({{"id": item.id, "name": item.name}}), 201
 """
 
 # API Registration Template - Wires controllers into the main API
 API_REG_PATCH = """
 from flask import Blueprint
-from .{{bc}}.{{name}}_controller import bp as {{name}}_bp, init_controller as init_{{name}}_controller
+from .{bc}.{name}_controller import bp as {name}_bp, init_controller as init_{name}_controller
 
-def register_{{name}}(api: Blueprint, container) -> None:
-    init_{{name}}_controller(container)
-    api.register_blueprint({{name}}_bp)
+def register_{name}(api: Blueprint, container) -> None:
+    init_{name}_controller(container)
+    api.register_blueprint({name}_bp)
 """
 
 # --- Test Templates ---
@@ -288,6 +297,126 @@ def test_http_smoke():
     assert r.status_code == 200
 """
 
+
+@functools.lru_cache(maxsize=1)
+def _env() -> Environment:
+    """
+    Build the shared code-generation environment, once per process.
+
+    The templates are module-level string constants, so there is nothing to
+    reload between commands: one Environment compiles each template a single
+    time (get_template caches by name) instead of re-parsing them on every
+    generator invocation. Jinja2 is imported here, not at module scope, so
+    CLI startup doesn't pay for it unless a Jinja template actually renders.
+    """
+    from jinja2 import DictLoader, Environment
+
+    return Environment(
+        loader=DictLoader(
+            {
+                "controller": CONTROLLER_TMPL,
+                "test_domain": TEST_DOMAIN_TMPL,
+                "test_app": TEST_APP_TMPL,
+                "test_infra": TEST_INFRA_TMPL,
+                "test_http": TEST_HTTP_TMPL,
+            }
+        )
+    )
+
+
+# Templates simple enough for plain {Var} substitution - no filters, loops,
+# or conditionals - rendered with str.format instead of Jinja2
+_FORMAT_TEMPLATES = {
+    "entity": ENTITY_TMPL,
+    "repo_iface": REPO_IFACE_TMPL,
+    "repo_sqla": REPO_SQLA_TMPL,
+    "service": SERVICE_TMPL,
+    "controller_basic": CONTROLLER_BASIC_TMPL,
+    "api_reg": API_REG_PATCH,
+}
+
+
+def _render(template_name: str, **context: str) -> str:
+    """
+    Render a named template with the given context.
+
+    Trivial templates render via str.format (a single C-level string
+    operation); templates that use Jinja2 features go through the shared
+    environment. The trailing newline is trimmed to match Jinja2's default
+    behaviour so generated files are byte-identical either way.
+    """
+    template = _FORMAT_TEMPLATES.get(template_name)
+    if template is not None:
+        rendered = template.format(**context)
+        return rendered[:-1] if rendered.endswith("\n") else rendered
+    return _env().get_template(template_name).render(**context)
+
+
+def _to_bytes_template(template: str) -> bytes:
+    """Convert a str.format template into a %-style bytes template."""
+    parts: list[str] = []
+    for literal, field, _spec, _conv in string.Formatter().parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field is not None:
+            parts.append(f"%({field})s")
+    return "".join(parts).encode("utf-8")
+
+
+# The templates and the values substituted into them are ASCII, so each
+# format template is encoded to UTF-8 once at import; rendering then
+# substitutes and produces the file payload without a per-render
+# str -> bytes encode.
+_BYTES_TEMPLATES = {name: _to_bytes_template(tmpl) for name, tmpl in _FORMAT_TEMPLATES.items()}
+
+
+def _render_bytes(template_name: str, **context: str) -> bytes:
+    """
+    Render a named template straight to the bytes written to disk.
+
+    Uses the pre-encoded bytes templates where available; Jinja2 templates
+    render to str first and are encoded on the way out.
+    """
+    template = _BYTES_TEMPLATES.get(template_name)
+    if template is None:
+        return _render(template_name, **context).encode("utf-8")
+    encoded = {key.encode("ascii"): value.encode("utf-8") for key, value in context.items()}
+    rendered = template % encoded
+    return rendered[:-1] if rendered.endswith(b"\n") else rendered
+
+
+# DI registration function appended to di_wiring.py for each new resource,
+# rendered with one .format call instead of stitching f-string pieces
+_REGISTER_FN_TMPL = '''
+
+
+def register_{name}(container: Container) -> None:
+    """Register {Entity} dependencies in the DI container."""
+    container.register(
+        "{bc}.{name}.repo",
+        lambda: SqlAlchemy{Entity}Repository(container.get("db.session_factory")),
+    )
+    container.register(
+        "{bc}.{name}.service",
+        container.factory({Entity}Service, repo="{bc}.{name}.repo"),
+    )
+'''
+
+
+# Wiring patterns compiled once at import time; resource() applies several of
+# them per invocation and string patterns would round-trip through re's
+# pattern cache on every call.
+_RE_IMPORTS = re.compile(
+    r"(?ms)(^from\s+[^\n]+$|^import\s+[^\n]+$)(?:\n(?:from\s+[^\n]+$|import\s+[^\n]+$))*"
+)
+_RE_BUILD_API = re.compile(r"(?ms)def\s+build_api_blueprint\([^\)]*\):\s*\n(.*?)\n\s*return\s+api")
+_RE_REGISTER_HTTP = re.compile(
+    r"(?ms)def\s+register_http\([^\)]*\):\s*\n(.*?)\n\s*app\.register_blueprint\(api_bp\)"
+)
+_RE_DEF_REGISTER_HTTP = re.compile(r"(def register_http)")
+_RE_CONFIGURE_OPENAPI = re.compile(r"(configure_openapi\(app\))")
+_RE_INIT_ENGINE = re.compile(r"from\s+\.\.\s*infra\.db\.base\s+import\s+init_engine\s*$")
+
+
 # --- Command Implementations ---
 
 
@@ -350,22 +479,13 @@ def entity(
     bc = bc.replace("-", "_")  # Normalize bounded context name
     entity_class = name[0].upper() + name[1:]  # PascalCase for class names
 
-    env = Environment(
-        loader=DictLoader(
-            {
-                "entity": ENTITY_TMPL,
-                "repo_iface": REPO_IFACE_TMPL,
-            }
-        )
-    )
-
     pkg_root = Path("src") / pkg
 
     # Ensure domain directory exists
     ensure_init_files(pkg_root, [f"domain/{bc}"])
 
     # Generate domain layer files
-    _generate_domain_files(pkg, bc, entity_class, env)
+    _flush_writes(_generate_domain_files(pkg_root, bc, entity_class))
 
     rprint(
         f"[green]Entity generated:[/green] {bc}.{entity_class} (domain entity + repository interface)"
@@ -404,21 +524,13 @@ def repository(
         )
         raise typer.Exit(1)
 
-    env = Environment(
-        loader=DictLoader(
-            {
-                "repo_sqla": REPO_SQLA_TMPL,
-            }
-        )
-    )
-
     pkg_root = Path("src") / pkg
 
     # Ensure infrastructure directory exists
     ensure_init_files(pkg_root, [f"infra/{bc}"])
 
     # Generate infrastructure layer files
-    _generate_infrastructure_files(pkg, bc, entity_class, table_name, env)
+    _flush_writes(_generate_infrastructure_files(pkg_root, bc, entity_class, table_name))
 
     rprint(f"[green]Repository generated:[/green] {bc}.{entity_class} ({impl} implementation)")
 
@@ -450,21 +562,13 @@ def service(
         entity_class = name
         name = name + "Service"  # Add 'Service' suffix if not present
 
-    env = Environment(
-        loader=DictLoader(
-            {
-                "service": SERVICE_TMPL,
-            }
-        )
-    )
-
     pkg_root = Path("src") / pkg
 
     # Ensure application directory exists
     ensure_init_files(pkg_root, [f"app/{bc}"])
 
     # Generate application layer files
-    _generate_application_files(pkg, bc, entity_class, env)
+    _flush_writes(_generate_application_files(pkg_root, bc, entity_class))
 
     rprint(f"[green]Service generated:[/green] {bc}.{name} (application service)")
 
@@ -497,12 +601,6 @@ def controller(
 
     # Choose appropriate template based on OpenAPI availability
     template_name = "controller" if has_openapi else "controller_basic"
-    templates = {
-        "controller": CONTROLLER_TMPL,
-        "controller_basic": CONTROLLER_BASIC_TMPL,
-    }
-
-    env = Environment(loader=DictLoader(templates))
 
     pkg_root = Path("src") / pkg
 
@@ -510,10 +608,10 @@ def controller(
     ensure_init_files(pkg_root, [f"interfaces/http/{bc}"])
 
     # Generate interface layer files with appropriate template
-    _generate_interface_files(pkg, bc, entity_name, env, template_name)
+    _flush_writes(_generate_interface_files(pkg, pkg_root, bc, entity_name, template_name))
 
     # Wire the controller into the API surface
-    _wire_api_integration(pkg, bc, entity_name)
+    _wire_api_integration(pkg_root, bc, entity_name)
 
     controller_type = "OpenAPI-enabled" if has_openapi else "basic Flask"
     rprint(f"[green]Controller generated:[/green] {bc}.{entity_name} ({controller_type} blueprint)")
@@ -582,15 +680,20 @@ def resource(
     entity_class = entity[0].upper() + entity[1:]  # PascalCase for class names
     entity_name = entity[0].lower() + entity[1:]  # camelCase for instances
     table_name = entity_name + "s"  # Pluralized table name
+    pkg_root = Path("src") / pkg  # Base for every path the generators touch
 
     # Generate all code files
-    _generate_code_files(pkg, bc, entity_class, entity_name, table_name)
-
-    # Wire into API surface
-    _wire_api_integration(pkg, bc, entity_name)
-
-    # Setup dependency injection
-    _setup_dependency_injection(pkg, bc, entity_class, entity_name)
+    _generate_code_files(pkg, pkg_root, bc, entity_class, entity_name, table_name)
+
+    # The API surface and DI wiring edits touch different files, so the two
+    # read-modify-write passes can overlap
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        api_future = executor.submit(_wire_api_integration, pkg_root, bc, entity_name)
+        di_future = executor.submit(
+            _setup_dependency_injection, pkg, pkg_root, bc, entity_class, entity_name
+        )
+        api_future.result()
+        di_future.result()
 
     rprint(
         f"[green]Resource generated:[/green] {bc}.{entity_class} (domain/app/infra/interfaces + wiring)"
@@ -598,23 +701,10 @@ def resource(
 
 
 def _generate_code_files(
-    pkg: str, bc: str, entity_class: str, entity_name: str, table_name: str
+    pkg: str, pkg_root: Path, bc: str, entity_class: str, entity_name: str, table_name: str
 ) -> None:
     """Generate all the code files for the resource."""
-    env = Environment(
-        loader=DictLoader(
-            {
-                "entity": ENTITY_TMPL,
-                "repo_iface": REPO_IFACE_TMPL,
-                "repo_sqla": REPO_SQLA_TMPL,
-                "service": SERVICE_TMPL,
-                "controller": CONTROLLER_TMPL,
-                "api_reg": API_REG_PATCH,
-            }
-        )
-    )
 
-    pkg_root = Path("src") / pkg
     entity_name = entity_class.lower()
 
     # Ensure all necessary directories and __init__.py files exist
@@ -632,36 +722,32 @@ def _generate_code_files(
         ],
     )
 
-    # Generate domain layer files
-    _generate_domain_files(pkg, bc, entity_class, env)
-
-    # Generate infrastructure layer files
-    _generate_infrastructure_files(pkg, bc, entity_class, table_name, env)
-
-    # Generate application layer files
-    _generate_application_files(pkg, bc, entity_class, env)
-
-    # Generate interface layer files
-    _generate_interface_files(pkg, bc, entity_name, env)
+    # Render every layer up front, then push the independent file writes
+    # through the thread pool in one batch
+    writes = _generate_domain_files(pkg_root, bc, entity_class)
+    writes += _generate_infrastructure_files(pkg_root, bc, entity_class, table_name)
+    writes += _generate_application_files(pkg_root, bc, entity_class)
+    writes += _generate_interface_files(pkg, pkg_root, bc, entity_name)
+    _flush_writes(writes)
 
     # Generate test files for all layers
-    _generate_test_files(pkg, bc, entity_class, entity_name)
+    _generate_test_files(pkg, pkg_root, bc, entity_class, entity_name)
 
 
-def _append_to_entities_file(entities_file: Path, entity_class: str, env: Environment) -> None:
+def _append_to_entities_file(entities_file: Path, entity_class: str) -> None:
     """Append entity to entities.py file or create it if it doesn't exist."""
     if not entities_file.exists():
         # Create new file with header
         content = f"""from __future__ import annotations
 from dataclasses import dataclass
 
-{env.get_template("entity").render(Entity=entity_class).strip()}
+{_render("entity", Entity=entity_class).strip()}
 """
     else:
         # Read existing content and append new entity
         existing_content = entities_file.read_text(encoding="utf-8")
         if f"class {entity_class}:" not in existing_content:
-            entity_code = env.get_template("entity").render(Entity=entity_class).strip()
+            entity_code = _render("entity", Entity=entity_class).strip()
             # Remove the imports and dataclass import from the template
             entity_lines = entity_code.split("\n")
             entity_only = []
@@ -679,16 +765,16 @@ from dataclasses import dataclass
     entities_file.write_text(content, encoding="utf-8")
 
 
-def _append_to_repositories_file(repos_file: Path, entity_class: str, env: Environment) -> None:
+def _append_to_repositories_file(repos_file: Path, entity_class: str) -> None:
     """Append repository interface to repositories.py file or create it if it doesn't exist."""
     if not repos_file.exists():
         # Create new file
-        content = env.get_template("repo_iface").render(Entity=entity_class)
+        content = _render("repo_iface", Entity=entity_class)
     else:
         # Read existing content and append new repository interface
         existing_content = repos_file.read_text(encoding="utf-8")
         if f"class I{entity_class}Repository(" not in existing_content:
-            repo_code = env.get_template("repo_iface").render(Entity=entity_class)
+            repo_code = _render("repo_iface", Entity=entity_class)
             # Extract just the class definition from the template
             repo_lines = repo_code.split("\n")
             class_start = None
@@ -729,18 +815,28 @@ def _append_to_repositories_file(repos_file: Path, entity_class: str, env: Envir
 
 
 def _append_to_sqlalchemy_repo_file(
-    repo_file: Path, entity_class: str, table_name: str, bc: str, env: Environment
+    repo_file: Path, entity_class: str, table_name: str, bc: str
 ) -> None:
     """Append SQLAlchemy repository to repo_sqlalchemy.py file or create it if it doesn't exist."""
     if not repo_file.exists():
         # Create new file
-        content = env.get_template("repo_sqla").render(Entity=entity_class, bc=bc, table=table_name)
+        content = _render(
+            "repo_sqla",
+            Entity=entity_class,
+            bc=bc,
+            table=table_name,
+            entity_name=entity_class.lower(),
+        )
     else:
         # Read existing content and append new repository implementation
         existing_content = repo_file.read_text(encoding="utf-8")
         if f"class SqlAlchemy{entity_class}Repository(" not in existing_content:
-            repo_code = env.get_template("repo_sqla").render(
-                Entity=entity_class, bc=bc, table=table_name
+            repo_code = _render(
+                "repo_sqla",
+                Entity=entity_class,
+                bc=bc,
+                table=table_name,
+                entity_name=entity_class.lower(),
             )
 
             # Extract the class definitions from the template (both Row and Repository classes)
@@ -817,18 +913,18 @@ def _append_to_sqlalchemy_repo_file(
     repo_file.write_text(content, encoding="utf-8")
 
 
-def _append_to_services_file(
-    services_file: Path, entity_class: str, bc: str, env: Environment
-) -> None:
+def _append_to_services_file(services_file: Path, entity_class: str, bc: str) -> None:
     """Append service to services.py file or create it if it doesn't exist."""
     if not services_file.exists():
         # Create new file
-        content = env.get_template("service").render(Entity=entity_class, bc=bc)
+        content = _render("service", Entity=entity_class, bc=bc, entity_name=entity_class.lower())
     else:
         # Read existing content and append new service
         existing_content = services_file.read_text(encoding="utf-8")
         if f"class {entity_class}Service:" not in existing_content:
-            service_code = env.get_template("service").render(Entity=entity_class, bc=bc)
+            service_code = _render(
+                "service", Entity=entity_class, bc=bc, entity_name=entity_class.lower()
+            )
 
             # Extract the class definition from the template
             service_lines = service_code.split("\n")
@@ -884,99 +980,110 @@ def _append_to_services_file(
     services_file.write_text(content, encoding="utf-8")
 
 
-def _generate_domain_files(pkg: str, bc: str, entity_class: str, env: Environment) -> None:
-    """Generate domain layer files (entities and repository interfaces)."""
-    entity_name = entity_class.lower()
+def _flush_writes(writes: list[tuple[Path, bytes]]) -> None:
+    """
+    Write a batch of rendered files, concurrently when there are several.
 
-    # Create entity-specific subdirectory
-    entity_domain_path = Path(f"src/{pkg}/domain/{bc}/{entity_name}")
-    entity_domain_path.mkdir(parents=True, exist_ok=True)
+    The writes are independent whole-file operations that each block on
+    syscalls, so a small thread pool overlaps them. Rendering always happens
+    on the caller's thread; only the I/O is parallel.
+    """
+    if len(writes) <= 1:
+        for path, data in writes:
+            write_bytes(path, data)
+        return
+    with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+        list(executor.map(lambda pc: write_bytes(pc[0], pc[1]), writes))
 
-    # Generate entity in entity.py
-    entity_file = entity_domain_path / "entity.py"
-    entity_file.write_text(env.get_template("entity").render(Entity=entity_class), encoding="utf-8")
 
-    # Generate repository interface in repository.py
-    repo_file = entity_domain_path / "repository.py"
-    repo_file.write_text(
-        env.get_template("repo_iface").render(Entity=entity_class), encoding="utf-8"
-    )
+def _generate_domain_files(pkg_root: Path, bc: str, entity_class: str) -> list[tuple[Path, bytes]]:
+    """Render domain layer files (entities and repository interfaces)."""
+    entity_name = entity_class.lower()
 
-    # Create __init__.py for the entity subdirectory
-    init_file = entity_domain_path / "__init__.py"
-    init_file.write_text("", encoding="utf-8")
+    # Create entity-specific subdirectory
+    entity_domain_path = pkg_root / "domain" / bc / entity_name
+    os.makedirs(entity_domain_path, exist_ok=True)
+
+    return [
+        # Entity in entity.py
+        (entity_domain_path / "entity.py", _render_bytes("entity", Entity=entity_class)),
+        # Repository interface in repository.py
+        (entity_domain_path / "repository.py", _render_bytes("repo_iface", Entity=entity_class)),
+        # __init__.py for the entity subdirectory
+        (entity_domain_path / "__init__.py", b""),
+    ]
 
 
 def _generate_infrastructure_files(
-    pkg: str, bc: str, entity_class: str, table_name: str, env: Environment
-) -> None:
-    """Generate infrastructure layer files (repository implementations)."""
+    pkg_root: Path, bc: str, entity_class: str, table_name: str
+) -> list[tuple[Path, bytes]]:
+    """Render infrastructure layer files (repository implementations)."""
     entity_name = entity_class.lower()
 
     # Create entity-specific subdirectory
-    entity_infra_path = Path(f"src/{pkg}/infra/{bc}/{entity_name}")
-    entity_infra_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate SQLAlchemy repository implementation in repo_sqlalchemy.py
-    repo_file = entity_infra_path / "repo_sqlalchemy.py"
-    repo_file.write_text(
-        env.get_template("repo_sqla").render(
-            Entity=entity_class, bc=bc, table=table_name, entity_name=entity_name
+    entity_infra_path = pkg_root / "infra" / bc / entity_name
+    os.makedirs(entity_infra_path, exist_ok=True)
+
+    return [
+        # SQLAlchemy repository implementation in repo_sqlalchemy.py
+        (
+            entity_infra_path / "repo_sqlalchemy.py",
+            _render_bytes(
+                "repo_sqla", Entity=entity_class, bc=bc, table=table_name, entity_name=entity_name
+            ),
         ),
-        encoding="utf-8",
-    )
+        # __init__.py for the entity subdirectory
+        (entity_infra_path / "__init__.py", b""),
+    ]
 
-    # Create __init__.py for the entity subdirectory
-    init_file = entity_infra_path / "__init__.py"
-    init_file.write_text("", encoding="utf-8")
 
-
-def _generate_application_files(pkg: str, bc: str, entity_class: str, env: Environment) -> None:
-    """Generate application layer files (services)."""
+def _generate_application_files(
+    pkg_root: Path, bc: str, entity_class: str
+) -> list[tuple[Path, bytes]]:
+    """Render application layer files (services)."""
     entity_name = entity_class.lower()
 
     # Create entity-specific subdirectory
-    entity_app_path = Path(f"src/{pkg}/app/{bc}/{entity_name}")
-    entity_app_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate service in service.py
-    services_file = entity_app_path / "service.py"
-    services_file.write_text(
-        env.get_template("service").render(Entity=entity_class, bc=bc, entity_name=entity_name),
-        encoding="utf-8",
-    )
-
-    # Create __init__.py for the entity subdirectory
-    init_file = entity_app_path / "__init__.py"
-    init_file.write_text("", encoding="utf-8")
+    entity_app_path = pkg_root / "app" / bc / entity_name
+    os.makedirs(entity_app_path, exist_ok=True)
+
+    return [
+        # Service in service.py
+        (
+            entity_app_path / "service.py",
+            _render_bytes("service", Entity=entity_class, bc=bc, entity_name=entity_name),
+        ),
+        # __init__.py for the entity subdirectory
+        (entity_app_path / "__init__.py", b""),
+    ]
 
 
 def _generate_interface_files(
-    pkg: str, bc: str, entity_name: str, env: Environment, template_name: str = "controller"
-) -> None:
-    """Generate interface layer files (HTTP controllers)."""
+    pkg: str, pkg_root: Path, bc: str, entity_name: str, template_name: str = "controller"
+) -> list[tuple[Path, bytes]]:
+    """Render interface layer files (HTTP controllers)."""
     # Create entity-specific subdirectory
-    entity_interface_path = Path(f"src/{pkg}/interfaces/http/{bc}/{entity_name}")
-    entity_interface_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate HTTP controller in controller.py using specified template
-    controller_file = entity_interface_path / "controller.py"
-    controller_file.write_text(
-        env.get_template(template_name).render(pkg=pkg, bc=bc, name=entity_name), encoding="utf-8"
-    )
+    entity_interface_path = pkg_root / "interfaces" / "http" / bc / entity_name
+    os.makedirs(entity_interface_path, exist_ok=True)
 
-    # Create __init__.py for the entity subdirectory
-    init_file = entity_interface_path / "__init__.py"
-    init_content = """from .controller import bp, init_controller
+    # __init__.py for the entity subdirectory
+    init_content = b"""from .controller import bp, init_controller
 
 __all__ = ["bp", "init_controller"]
 """
-    init_file.write_text(init_content, encoding="utf-8")
+    return [
+        # HTTP controller in controller.py using the specified template
+        (
+            entity_interface_path / "controller.py",
+            _render_bytes(template_name, pkg=pkg, bc=bc, name=entity_name),
+        ),
+        (entity_interface_path / "__init__.py", init_content),
+    ]
 
 
-def _wire_api_integration(pkg: str, bc: str, entity_name: str) -> None:
+def _wire_api_integration(pkg_root: Path, bc: str, entity_name: str) -> None:
     """Wire the new resource into the API surface with robust, idempotent operations."""
-    api_file = Path(f"src/{pkg}/interfaces/http/api.py")
+    api_file = pkg_root / "interfaces" / "http" / "api.py"
     api_content = api_file.read_text(encoding="utf-8")
 
     # Define the lines to be inserted with subdirectory structure
@@ -987,6 +1094,9 @@ def _wire_api_integration(pkg: str, bc: str, entity_name: str) -> None:
     # Check if OpenAPI is available
     has_openapi = "from .ext.openapi import configure_openapi" in api_content
 
+    # Import lines destined for the auto-imports anchor, in insertion order
+    import_needles: list[str] = []
+
     if has_openapi:
         # For OpenAPI integration, ensure we have the necessary imports and wiring function
         openapi_import = "from .ext.openapi import get_api_instance"
@@ -1006,163 +1116,158 @@ def _wire_api_integration():
 
         # Insert OpenAPI import if not present
         if openapi_import not in api_content:
-            api_content = _insert_line_once(
-                api_content,
-                openapi_import,
-                "# [forge:auto-imports]",
-                r"(?ms)(^from\s+[^\n]+$|^import\s+[^\n]+$)(?:\n(?:from\s+[^\n]+$|import\s+[^\n]+$))*",
-            )
+            import_needles.append(openapi_import)
 
         # Add the wire function if it doesn't exist
         if "_wire_api_integration" not in api_content:
             # Insert before register_http function
-            pattern = r"(def register_http)"
             replacement = wire_function + "\n\n\\1"
-            api_content = re.sub(pattern, replacement, api_content)
+            api_content = _RE_DEF_REGISTER_HTTP.sub(replacement, api_content)
 
         # Update the register_http function to call _wire_api_integration
         if "_wire_api_integration()" not in api_content:
             # Insert the call after configure_openapi
-            pattern = r"(configure_openapi\(app\))"
             replacement = "\\1\n    \n    # Wire OpenAPI integration after configuring it\n    _wire_api_integration()"
-            api_content = re.sub(pattern, replacement, api_content)
-
-    # Insert import, register, and init lines
-    api_content = _insert_line_once(
-        api_content,
-        import_line,
-        "# [forge:auto-imports]",
-        r"(?ms)(^from\s+[^\n]+$|^import\s+[^\n]+$)(?:\n(?:from\s+[^\n]+$|import\s+[^\n]+$))*",
-    )
-
-    api_content = _insert_line_once(
-        api_content,
-        register_line,
-        "    # [forge:auto-register]",
-        r"(?ms)def\s+build_api_blueprint\([^\)]*\):\s*\n(.*?)\n\s*return\s+api",
-    )
+            api_content = _RE_CONFIGURE_OPENAPI.sub(replacement, api_content)
+
+    # Insert import, register, and init lines. The three anchored insertions
+    # are batched into a single pass over the file instead of one full-text
+    # replace (and string copy) per line.
+    if import_line not in api_content:
+        import_needles.append(import_line)
+
+    pending: list[tuple[str, re.Pattern[str], list[str]]] = []
+    if import_needles:
+        pending.append(("# [forge:auto-imports]", _RE_IMPORTS, import_needles))
+    if register_line not in api_content:
+        pending.append(("    # [forge:auto-register]", _RE_BUILD_API, [register_line]))
+    if init_line not in api_content:
+        pending.append(("    # [forge:auto-init]", _RE_REGISTER_HTTP, [init_line]))
+
+    if pending:
+        out: list[str] = []
+        for line in api_content.split("\n"):
+            out.append(line)
+            for entry in pending:
+                anchor, _, needles = entry
+                idx = line.find(anchor)
+                if idx != -1:
+                    # Sequential replace() calls each re-inserted right after
+                    # the anchor text, so later needles sit closer to it and
+                    # any trailing text on the anchor line follows the first.
+                    cut = idx + len(anchor)
+                    out[-1] = line[:cut]
+                    placed = list(reversed(needles))
+                    placed[-1] += line[cut:]
+                    out.extend(placed)
+                    pending.remove(entry)
+                    break
+        api_content = "\n".join(out)
 
-    api_content = _insert_line_once(
-        api_content,
-        init_line,
-        "    # [forge:auto-init]",
-        r"(?ms)def\s+register_http\([^\)]*\):\s*\n(.*?)\n\s*app\.register_blueprint\(api_bp\)",
-    )
+        # Hand-edited files may lack the anchor comments; fall back to the
+        # regex insertion points for anything not yet placed.
+        for anchor, fallback, needles in pending:
+            for needle in needles:
+                api_content = _insert_line_once(api_content, needle, anchor, fallback)
 
     api_file.write_text(api_content, encoding="utf-8")
 
 
-def _setup_dependency_injection(pkg: str, bc: str, entity_class: str, entity_name: str) -> None:
-    """Setup dependency injection wiring for the new resource."""
-    wiring_file = Path(f"src/{pkg}/shared/di_wiring.py")
+def _setup_dependency_injection(
+    pkg: str, pkg_root: Path, bc: str, entity_class: str, entity_name: str
+) -> None:
+    """Setup dependency injection wiring for the new resource.
+
+    The file is split into lines once; import insertion, the registration
+    function append, and the register_features call all edit that one list,
+    which is joined and written back in a single pass.
+    """
+    wiring_file = pkg_root / "shared" / "di_wiring.py"
     wiring_content = wiring_file.read_text(encoding="utf-8")
+    lines = wiring_content.split("\n")
 
     # Add imports for repository and service from subdirectories
     import_repo = f"from {pkg}.infra.{bc}.{entity_name}.repo_sqlalchemy import SqlAlchemy{entity_class}Repository\n"
     import_service = f"from {pkg}.app.{bc}.{entity_name}.service import {entity_class}Service\n"
 
-    wiring_content = _insert_after_line(
-        wiring_content,
-        r"from\s+\.\.\s*infra\.db\.base\s+import\s+init_engine\s*\n",
-        import_repo + import_service,
-    )
+    if import_repo + import_service not in wiring_content:
+        import_lines = [import_repo[:-1], import_service[:-1]]
+        anchor = next((i for i, line in enumerate(lines) if _RE_INIT_ENGINE.search(line)), None)
+        if anchor is None:
+            lines[:0] = import_lines
+        else:
+            # Place the imports after the init_engine import and any blank
+            # lines directly below it
+            idx = anchor + 1
+            while idx < len(lines) and not lines[idx].strip():
+                idx += 1
+            lines[idx:idx] = import_lines
 
     # Add registration function if it doesn't exist
     func_signature = f"def register_{entity_name}(container"
     if func_signature not in wiring_content:
-        registration_func = (
-            f"\n\n\ndef register_{entity_name}(container: Container) -> None:\n"
-            f'    """Register {entity_class} dependencies in the DI container."""\n'
-            f"    container.register(\n"
-            f'        "{bc}.{entity_name}.repo",\n'
-            f'        lambda: SqlAlchemy{entity_class}Repository(container.get("db.session_factory")),\n'
-            f"    )\n"
-            f"    container.register(\n"
-            f'        "{bc}.{entity_name}.service",\n'
-            f'        container.factory({entity_class}Service, repo="{bc}.{entity_name}.repo"),\n'
-            f"    )\n"
-        )
-        wiring_content += registration_func
-
-    # Add call to registration function in register_features
+        registration_func = _REGISTER_FN_TMPL.format(name=entity_name, bc=bc, Entity=entity_class)
+        func_lines = registration_func.split("\n")
+        lines[-1] += func_lines[0]
+        lines.extend(func_lines[1:])
+
+    # Add call to registration function in register_features. The function is
+    # located by index and the call spliced in place, so only its short body
+    # is scanned instead of copying every line of the file.
     call_line = f"    register_{entity_name}(container)"
     if "def register_features(" in wiring_content and call_line not in wiring_content:
-        # Find the register_features function and add the call
-        lines = wiring_content.split("\n")
-        new_lines = []
-        in_register_features = False
-        added_call = False
-
-        for i, line in enumerate(lines):
-            new_lines.append(line)
-
-            # Detect start of register_features function
-            if "def register_features(container: Container) -> None:" in line:
-                in_register_features = True
-                continue
-
-            # If we're in register_features and find the end of function
-            if (
-                in_register_features
-                and line.strip() == ""
-                and i + 1 < len(lines)
-                and lines[i + 1].strip()
-                and not lines[i + 1].startswith("    ")
-            ):
-                # End of function, add call before this line if not added yet
-                if not added_call:
-                    # Insert before the empty line
-                    new_lines.insert(-1, call_line)
-                    added_call = True
-                in_register_features = False
-                continue
-
-            # If we're in register_features and find a pass statement, replace it
-            if in_register_features and line.strip() == "pass":
-                new_lines[-1] = call_line  # Replace the pass line
-                added_call = True
-                continue
-
-            # If we're in register_features and find an existing register call, add after all calls
-            if (
-                in_register_features
-                and "register_" in line
-                and "(container)" in line
-                and not added_call
-            ):
-                # Look ahead to see if there are more register calls
-                has_more_calls = False
-                for j in range(i + 1, len(lines)):
-                    if lines[j].strip() == "":
-                        break
-                    if "register_" in lines[j] and "(container)" in lines[j]:
-                        has_more_calls = True
-                        break
+        def_idx = next(
+            (
+                i
+                for i, line in enumerate(lines)
+                if "def register_features(container: Container) -> None:" in line
+            ),
+            None,
+        )
+        if def_idx is not None:
+            j = def_idx + 1
+            while j < len(lines):
+                line = lines[j]
+                stripped = line.strip()
+
+                # Blank line followed by unindented code ends the function:
+                # insert before the blank
+                if (
+                    stripped == ""
+                    and j + 1 < len(lines)
+                    and lines[j + 1].strip()
+                    and not lines[j + 1].startswith("    ")
+                ):
+                    lines.insert(j, call_line)
+                    break
 
-                # If no more calls after this one, add our call
-                if not has_more_calls:
-                    new_lines.append(call_line)
-                    added_call = True
+                # A pass statement placeholder is replaced outright
+                if stripped == "pass":
+                    lines[j] = call_line
+                    break
 
-        wiring_content = "\n".join(new_lines)
+                # After the last existing register call in the block
+                if "register_" in line and "(container)" in line:
+                    has_more_calls = False
+                    for k in range(j + 1, len(lines)):
+                        if lines[k].strip() == "":
+                            break
+                        if "register_" in lines[k] and "(container)" in lines[k]:
+                            has_more_calls = True
+                            break
+                    if not has_more_calls:
+                        lines.insert(j + 1, call_line)
+                        break
 
-    wiring_file.write_text(wiring_content, encoding="utf-8")
+                j += 1
 
+    wiring_file.write_text("\n".join(lines), encoding="utf-8")
 
-def _generate_test_files(pkg: str, bc: str, entity_class: str, entity_name: str) -> None:
-    """Generate test files for each layer of the resource."""
-    env = Environment(
-        loader=DictLoader(
-            {
-                "test_domain": TEST_DOMAIN_TMPL,
-                "test_app": TEST_APP_TMPL,
-                "test_infra": TEST_INFRA_TMPL,
-                "test_http": TEST_HTTP_TMPL,
-            }
-        )
-    )
 
-    pkg_root = Path("src") / pkg
+def _generate_test_files(
+    pkg: str, pkg_root: Path, bc: str, entity_class: str, entity_name: str
+) -> None:
+    """Generate test files for each layer of the resource."""
 
     # Ensure test directories and __init__.py files exist
     ensure_init_files(
@@ -1177,31 +1282,31 @@ def _generate_test_files(pkg: str, bc: str, entity_class: str, entity_name: str)
 
     # Generate domain layer test
     (pkg_root / f"tests/domain/{bc}/test_entities.py").write_text(
-        env.get_template("test_domain").render(pkg=pkg, bc=bc, Entity=entity_class),
+        _render("test_domain", pkg=pkg, bc=bc, Entity=entity_class),
         encoding="utf-8",
     )
 
     # Generate application layer test
     (pkg_root / f"tests/app/{bc}/test_services.py").write_text(
-        env.get_template("test_app").render(pkg=pkg, bc=bc, Entity=entity_class),
+        _render("test_app", pkg=pkg, bc=bc, Entity=entity_class),
         encoding="utf-8",
     )
 
     # Generate infrastructure layer test
     (pkg_root / f"tests/infra/{bc}/test_repo_sqlalchemy.py").write_text(
-        env.get_template("test_infra").render(pkg=pkg, bc=bc, Entity=entity_class),
+        _render("test_infra", pkg=pkg, bc=bc, Entity=entity_class),
         encoding="utf-8",
     )
 
     # Generate interface layer test
     (pkg_root / f"tests/interfaces/http/test_{entity_name}.py").write_text(
-        env.get_template("test_http").render(pkg=pkg, name=entity_name),
+        _render("test_http", pkg=pkg, name=entity_name),
         encoding="utf-8",
     )
 
 
 def _insert_line_once(
-    text: str, needle: str, anchor: str, fallback_pattern: str | None = None
+    text: str, needle: str, anchor: str, fallback_pattern: re.Pattern[str] | None = None
 ) -> str:
     """
     Insert a line into text only if it doesn't already exist.
@@ -1210,7 +1315,7 @@ def _insert_line_once(
         text: The text to modify
         needle: The line to insert
         anchor: The anchor line to insert after
-        fallback_pattern: Regex pattern for fallback insertion point
+        fallback_pattern: Compiled regex for fallback insertion point
 
     Returns:
         Modified text with the needle inserted
@@ -1220,32 +1325,13 @@ def _insert_line_once(
     if anchor in text:
         return text.replace(anchor, anchor + "\n" + needle)
     if fallback_pattern:
-        match = re.search(fallback_pattern, text, re.DOTALL)
+        match = fallback_pattern.search(text)
         if match:
             _, end = match.span()
             return text[:end] + "\n" + needle + text[end:]
     return text.rstrip() + "\n" + needle + "\n"
 
 
-def _insert_after_line(text: str, after_pattern: str, payload: str) -> str:
-    """
-    Insert payload after a line matching the given pattern.
-
-    Args:
-        text: The text to modify
-        after_pattern: Regex pattern to find insertion point
-        payload: Text to insert
-
-    Returns:
-        Modified text with payload inserted
-    """
-    match = re.search(after_pattern, text)
-    if not match:
-        return text if payload in text else (payload + text)
-    idx = match.end()
-    return text if payload in text else (text[:idx] + payload + text[idx:])
-
-
 def _detect_package() -> str:
     """
     Detect the package name by looking for main.py in src/ subdirectories.
@@ -1256,6 +1342,7 @@ def _detect_package() -> str:
     Raises:
         SystemExit: If no package is detected
     """
-    for path in Path("src").glob("*/main.py"):
-        return path.parent.name
-    raise SystemExit("Could not detect src/<package>")
+    pkg = detect_package()
+    if pkg is None:
+        raise SystemExit("Could not detect src/<package>")
+    return pkg
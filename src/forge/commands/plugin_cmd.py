@@ -2,7 +2,9 @@ from __future__ import annotations
 import re
 from pathlib import Path
 import typer
-from rich import print as rprint
+from rich.console import Console, Group
+
+from ..utils.fs import detect_package
 
 plugin = typer.Typer(help="Optional features")
 
@@ -12,11 +14,20 @@ API_INIT_CALL = "configure_openapi(app)"
 FORGE_AUTO_IMPORTS = "# [forge:auto-imports]"
 FORGE_AUTO_INIT = "# [forge:auto-init]"
 
+# Dependencies required by the OpenAPI plugin. One multi-alternation pattern
+# finds every present dependency in a single pass over pyproject.toml.
+REQUIRED_DEPS = ("flask-smorest", "marshmallow")
+_DEP_RE = re.compile(rf'["\']({"|".join(REQUIRED_DEPS)})[]"><=~!\s]')
+
+# Top-level import statement, used to find where new imports belong
+_RE_IMPORT_LINE = re.compile(r"^(?:from|import)\s")
+
 
 def _detect_pkg() -> str:
-    for p in Path("src").glob("*/main.py"):
-        return p.parent.name
-    raise SystemExit("pkg not found")
+    pkg = detect_package()
+    if pkg is None:
+        raise SystemExit("pkg not found")
+    return pkg
 
 
 @plugin.command("openapi")
@@ -33,51 +44,53 @@ def openapi():
     if not api_file.exists():
         raise SystemExit(f"API file not found: {api_file}")
 
+    # Status lines are buffered and rendered with one Console.print at the
+    # end — one lock acquisition and one flush instead of one per message.
+    messages: list[str] = []
+
     # Create ext/openapi.py
     ext_dir = root / f"src/{pkg}/interfaces/http/ext"
     ext_dir.mkdir(parents=True, exist_ok=True)
     openapi_file = ext_dir / "openapi.py"
 
     if openapi_file.exists():
-        rprint("[yellow]OpenAPI extension already exists, skipping creation")
+        messages.append("[yellow]OpenAPI extension already exists, skipping creation")
     else:
         openapi_file.write_text(_OPENAPI_EXT, encoding="utf-8")
-        rprint("[green]Created OpenAPI extension file")
+        messages.append("[green]Created OpenAPI extension file")
 
     # Update dependencies
     if _update_pyproject_dependencies(root / "pyproject.toml"):
-        rprint("[green]Updated pyproject.toml dependencies")
+        messages.append("[green]Updated pyproject.toml dependencies")
     else:
-        rprint("[yellow]Dependencies already up to date")
+        messages.append("[yellow]Dependencies already up to date")
 
     # Update API file
-    rprint(f"[blue]Updating API file: {api_file}")
-    if _update_api_file(api_file):
-        rprint("[green]Updated API file with OpenAPI integration")
+    messages.append(f"[blue]Updating API file: {api_file}")
+    if _update_api_file(api_file, messages):
+        messages.append("[green]Updated API file with OpenAPI integration")
     else:
-        rprint("[yellow]API file already configured")
+        messages.append("[yellow]API file already configured")
 
     # Register existing controllers with OpenAPI
-    _register_existing_controllers(root, pkg)
+    _register_existing_controllers(root, pkg, messages)
+
+    messages.append("[green]✓ OpenAPI installed.")
+    messages.append("[blue]Available routes:")
+    messages.append("[blue]  • Swagger UI: /docs/swagger-ui")
+    messages.append("[blue]  • ReDoc: /docs/redoc")
+    messages.append("[blue]  • OpenAPI spec: /docs/openapi.json")
 
-    rprint("[green]✓ OpenAPI installed.")
-    rprint("[blue]Available routes:")
-    rprint("[blue]  • Swagger UI: /docs/swagger-ui")
-    rprint("[blue]  • ReDoc: /docs/redoc")
-    rprint("[blue]  • OpenAPI spec: /docs/openapi.json")
+    Console().print(Group(*messages))
 
 
 def _update_pyproject_dependencies(pyproject_path: Path) -> bool:
     """Update pyproject.toml dependencies. Returns True if changes were made."""
     content = pyproject_path.read_text(encoding="utf-8")
-    required_deps = ["flask-smorest", "marshmallow"]
 
-    # Check if deps exist and track missing ones
-    missing_deps: list[str] = []
-    for dep in required_deps:
-        # Look for the dependency with proper word boundaries
-        if not re.search(rf'["\']({dep})[]"><=~!\s]', content):
-            missing_deps.append(dep)
+    # Find declared deps in one scan; anything not matched is missing
+    found = {match.group(1) for match in _DEP_RE.finditer(content)}
+    missing_deps = [dep for dep in REQUIRED_DEPS if dep not in found]
 
     if not missing_deps:
         return False
@@ -92,106 +105,95 @@ def _update_pyproject_dependencies(pyproject_path: Path) -> bool:
                 deps_to_insert = "".join(f'"{dep}>=0",' for dep in missing_deps)
                 lines[i] = line[:closing_bracket] + deps_to_insert + line[closing_bracket:]
             else:
-                # Multi-line: add after the opening bracket
-                for j, dep in enumerate(missing_deps):
-                    lines.insert(i + 1 + j, f'    "{dep}>=0",')
+                # Multi-line: splice all deps in after the opening bracket at
+                # once, shifting the tail of the list a single time
+                lines[i + 1 : i + 1] = [f'    "{dep}>=0",' for dep in missing_deps]
             break
 
     pyproject_path.write_text("\n".join(lines), encoding="utf-8")
     return True
 
 
-def _update_api_file(api_file: Path) -> bool:
+def _update_api_file(api_file: Path, messages: list[str]) -> bool:
     """Update api.py file to include OpenAPI. Returns True if changes were made."""
     content = api_file.read_text(encoding="utf-8")
+    need_import = OPENAPI_IMPORT not in content
+    need_init = API_INIT_CALL not in content
+    if not (need_import or need_init):
+        # Idempotent rerun: both pieces are in place, skip the line scan
+        return False
+
     lines = content.split("\n")
     modified = False
 
-    rprint("[blue]Checking if OpenAPI import exists...")
-    if OPENAPI_IMPORT not in content:
-        rprint("[blue]Adding OpenAPI import...")
-        if _add_openapi_import(lines):
-            modified = True
-            rprint("[green]✓ Added OpenAPI import")
+    # One pass over the lines gathers every index both insertions need,
+    # instead of each helper re-scanning from the top.
+    auto_imports_idx = -1  # first line carrying the forge auto-imports marker
+    last_import_idx = -1  # last top-level import statement
+    first_code_idx = -1  # first non-comment, non-blank line
+    init_insert_idx = -1  # where configure_openapi(app) goes inside register_http
+    in_register_http = False
+
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if auto_imports_idx < 0 and FORGE_AUTO_IMPORTS in line:
+            auto_imports_idx = i
+        if _RE_IMPORT_LINE.match(line):
+            last_import_idx = i
+        if first_code_idx < 0 and stripped and not line.startswith("#"):
+            first_code_idx = i
+        if not in_register_http and init_insert_idx < 0 and "def register_http(app" in line:
+            in_register_http = True
+            continue
+        if in_register_http:
+            if FORGE_AUTO_INIT in line:
+                # Insert after the marker
+                init_insert_idx = i + 1
+                in_register_http = False
+            elif stripped and not line.startswith("    #"):
+                # Insert before first non-comment line in function
+                init_insert_idx = i
+                in_register_http = False
+
+    messages.append("[blue]Checking if OpenAPI import exists...")
+    if need_import:
+        messages.append("[blue]Adding OpenAPI import...")
+        if auto_imports_idx >= 0:
+            # The forge marker line is replaced in place, keeping the marker
+            lines[auto_imports_idx] = f"{OPENAPI_IMPORT}\n{FORGE_AUTO_IMPORTS}"
+        else:
+            if last_import_idx >= 0:
+                insert_idx = last_import_idx + 1
+            elif first_code_idx >= 0:
+                # No imports found: add after initial comments
+                insert_idx = first_code_idx
+            else:
+                insert_idx = 0
+            lines.insert(insert_idx, OPENAPI_IMPORT)
+            if insert_idx <= init_insert_idx:
+                init_insert_idx += 1
+        modified = True
+        messages.append("[green]✓ Added OpenAPI import")
     else:
-        rprint("[yellow]OpenAPI import already exists")
+        messages.append("[yellow]OpenAPI import already exists")
 
-    rprint("[blue]Checking if configure_openapi(app) exists...")
-    if API_INIT_CALL not in content:
-        rprint("[blue]Adding configure_openapi(app) call...")
-        if _add_api_init_call(lines):
+    messages.append("[blue]Checking if configure_openapi(app) exists...")
+    if need_init:
+        messages.append("[blue]Adding configure_openapi(app) call...")
+        if init_insert_idx >= 0:
+            lines.insert(init_insert_idx, f"    {API_INIT_CALL}")
             modified = True
-            rprint("[green]✓ Added configure_openapi(app) call")
+            messages.append("[green]✓ Added configure_openapi(app) call")
     else:
-        rprint("[yellow]configure_openapi(app) already exists")
+        messages.append("[yellow]configure_openapi(app) already exists")
 
     if modified:
         api_file.write_text("\n".join(lines), encoding="utf-8")
-        rprint("[green]✓ API file updated successfully")
+        messages.append("[green]✓ API file updated successfully")
 
     return modified
 
 
-def _add_openapi_import(lines: list[str]) -> bool:
-    """Add OpenAPI import to the lines. Returns True if modified."""
-    # Check if already exists
-    if any(OPENAPI_IMPORT in line for line in lines):
-        return False
-
-    # Try forge marker first
-    for i, line in enumerate(lines):
-        if FORGE_AUTO_IMPORTS in line:
-            lines[i] = f"{OPENAPI_IMPORT}\n{FORGE_AUTO_IMPORTS}"
-            return True
-
-    # Find insertion point after imports or at beginning
-    insert_idx = _find_import_insertion_point(lines)
-    lines.insert(insert_idx, OPENAPI_IMPORT)
-    return True
-
-
-def _find_import_insertion_point(lines: list[str]) -> int:
-    """Find the best place to insert an import statement."""
-    # Find last import line
-    last_import_idx = -1
-    for i, line in enumerate(lines):
-        if line.strip() and ("import " in line or "from " in line) and not line.startswith("#"):
-            last_import_idx = i
-
-    if last_import_idx >= 0:
-        return last_import_idx + 1
-
-    # If no imports found, add after initial comments
-    for i, line in enumerate(lines):
-        if line.strip() and not line.startswith("#"):
-            return i
-
-    # Fallback: beginning of file
-    return 0
-
-
-def _add_api_init_call(lines: list[str]) -> bool:
-    """Add configure_openapi(app) call. Returns True if modified."""
-    # Check if already exists
-    if any(API_INIT_CALL in line for line in lines):
-        return False
-
-    for i, line in enumerate(lines):
-        if "def register_http(app" in line:
-            # Look for forge marker
-            for j in range(i + 1, len(lines)):
-                if FORGE_AUTO_INIT in lines[j]:
-                    # Insert before the existing content, after the marker
-                    lines.insert(j + 1, f"    {API_INIT_CALL}")
-                    return True
-                elif lines[j].strip() and not lines[j].startswith("    #"):
-                    # Insert before first non-comment line in function
-                    lines.insert(j, f"    {API_INIT_CALL}")
-                    return True
-            break
-    return False
-
-
 _OPENAPI_EXT = """
 from __future__ import annotations
 from flask_smorest import Api
@@ -251,7 +253,7 @@ def _register_existing_blueprints(app: Flask):
 """
 
 
-def _register_existing_controllers(root: Path, pkg: str) -> None:
+def _register_existing_controllers(root: Path, pkg: str, messages: list[str]) -> None:
     """Register existing controller blueprints with OpenAPI."""
     api_file = root / f"src/{pkg}/interfaces/http/api.py"
     if not api_file.exists():
@@ -262,10 +264,10 @@ def _register_existing_controllers(root: Path, pkg: str) -> None:
     controller_files = list(controllers_path.glob("**/controller.py"))
 
     if not controller_files:
-        rprint("[yellow]No existing controllers found")
+        messages.append("[yellow]No existing controllers found")
         return
 
-    rprint(f"[blue]Found {len(controller_files)} existing controllers")
+    messages.append(f"[blue]Found {len(controller_files)} existing controllers")
 
     # Update api.py to register existing controllers with OpenAPI
     content = api_file.read_text(encoding="utf-8")
@@ -282,7 +284,7 @@ def _register_existing_controllers(root: Path, pkg: str) -> None:
             controllers.append((bc, entity))
 
     if not controllers:
-        rprint("[yellow]No valid controllers found")
+        messages.append("[yellow]No valid controllers found")
         return
 
     # Update register_http function to use OpenAPI
@@ -290,9 +292,9 @@ def _register_existing_controllers(root: Path, pkg: str) -> None:
 
     if modified:
         api_file.write_text("\n".join(lines), encoding="utf-8")
-        rprint("[green]✓ Updated API file with OpenAPI registrations")
+        messages.append("[green]✓ Updated API file with OpenAPI registrations")
     else:
-        rprint("[yellow]API file already configured for OpenAPI")
+        messages.append("[yellow]API file already configured for OpenAPI")
 
 
 def _update_register_http_for_openapi(lines: list[str], controllers: list[tuple[str, str]]) -> bool:
@@ -20,6 +20,8 @@ from pathlib import Path
 import typer
 from rich import print as rprint
 
+from ..utils.fs import detect_package
+
 run = typer.Typer(help="Run utilities")
 
 
@@ -27,6 +29,9 @@ run = typer.Typer(help="Run utilities")
 def dev(
     module: str = typer.Option(None, help="Python package to run (auto-detect if omitted)"),
     port: int = typer.Option(8000, "--port", "-p"),
+    fast: bool = typer.Option(
+        False, "--fast", help="Start from hash-checked cached bytecode instead of runpy"
+    ),
 ):
     """
     Start the development server for the application.
@@ -45,6 +50,7 @@ def dev(
         forge run dev --port 3000        # Auto-detect package, use port 3000
         forge run dev --module myapp     # Run specific package
         forge run dev -p 5000            # Short form for port option
+        forge run dev --fast             # Reuse cached bytecode when unchanged
 
     Entry Point Resolution:
         1. First tries to run <package>.__main__ (if __main__.py exists)
@@ -71,7 +77,8 @@ def dev(
     # Start the application
     rprint(f"[green]Starting[/green] python -m {target_module} on port {port}")
     try:
-        runpy.run_module(target_module, run_name="__main__")
+        if not (fast and _run_cached_bytecode(target_module)):
+            runpy.run_module(target_module, run_name="__main__")
     except ModuleNotFoundError as e:
         rprint(f"[red]Error:[/red] Could not find module '{target_module}': {e}")
         raise typer.Exit(1)
@@ -80,6 +87,93 @@ def dev(
         raise typer.Exit(1)
 
 
+def _run_cached_bytecode(target_module: str) -> bool:
+    """
+    Execute the entry-point module from hash-checked cached bytecode.
+
+    The cached .pyc is validated against the current source hash and only
+    recompiled on mismatch, so repeat dev starts with unchanged source skip
+    parse and compile and load the marshalled code directly.
+
+    Args:
+        target_module: Full module path (e.g., "myapp.main")
+
+    Returns:
+        True if the module was executed, False if the fast path could not
+        be prepared (missing spec, compile failure, unreadable cache) and
+        the caller should fall back to runpy
+    """
+    import importlib.util
+    import marshal
+    import py_compile
+
+    try:
+        spec = importlib.util.find_spec(target_module)
+        if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+            return False
+        with open(spec.origin, "rb") as f:
+            source_hash = importlib.util.source_hash(f.read())
+        data = _read_cache(importlib.util.cache_from_source(spec.origin), source_hash)
+        if data is None:
+            # Missing, stale, or timestamp-based cache: compile once with
+            # hash invalidation so later runs can reuse it
+            cache_file = py_compile.compile(
+                spec.origin,
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+            )
+            with open(cache_file, "rb") as f:
+                data = f.read()
+        code = marshal.loads(data[16:])
+    except Exception:
+        return False
+
+    # App-level errors propagate to dev()'s handlers like the runpy path
+    exec(
+        code,
+        {
+            "__name__": "__main__",
+            "__file__": spec.origin,
+            "__package__": target_module.rpartition(".")[0],
+            "__spec__": spec,
+            "__loader__": spec.loader,
+        },
+    )
+    return True
+
+
+def _read_cache(cache_file: str, source_hash: bytes) -> bytes | None:
+    """
+    Read a cached .pyc if it is hash-based and matches the source hash.
+
+    The 16-byte pyc header holds the magic number, an invalidation flags
+    word, and — for hash-based caches — the 8-byte source hash. Comparing
+    that stored hash against the current one answers "is this cache fresh"
+    without invoking the compiler.
+
+    Args:
+        cache_file: Path to the .pyc as computed by cache_from_source
+        source_hash: importlib.util.source_hash of the current source bytes
+
+    Returns:
+        The raw pyc bytes when valid, None when the cache is missing,
+        truncated, from another interpreter, timestamp-based, or stale
+    """
+    import importlib.util
+
+    try:
+        with open(cache_file, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < 16 or data[:4] != importlib.util.MAGIC_NUMBER:
+        return None
+    flags = int.from_bytes(data[4:8], "little")
+    if not flags & 0b1 or data[8:16] != source_hash:
+        return None
+    return data
+
+
 def _determine_entry_point(pkg: str) -> str:
     """
     Determine the appropriate entry point module for the package.
@@ -111,17 +205,11 @@ def _guess_package() -> str | None:
     """
     Automatically detect the main package from the project structure.
 
-    Searches the src/ directory for packages containing main.py files,
-    which indicates they are likely the main application package.
+    Delegates to the shared, cached detect_package scan of src/.
 
     Returns:
         Package name if found, None if no suitable package is detected
 
-    Detection Logic:
-        - Looks for src/<package>/main.py files
-        - Returns the first package found with this structure
-        - Returns None if src/ directory doesn't exist or no packages found
-
     Example:
         For a project structure like:
         src/
@@ -131,13 +219,4 @@ def _guess_package() -> str | None:
 
         This function would return "myapp"
     """
-    src_dir = Path("src")
-    if not src_dir.exists():
-        return None
-
-    # Look for directories with main.py files
-    for pkg_dir in src_dir.iterdir():
-        if pkg_dir.is_dir() and (pkg_dir / "main.py").exists():
-            return pkg_dir.name
-
-    return None
+    return detect_package()
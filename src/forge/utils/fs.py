@@ -12,9 +12,68 @@ Key features:
 - Safe file operations with proper encoding handling
 """
 
+import functools
+import os
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
+def detect_package() -> str | None:
+    """
+    Detect the application package by scanning src/ for a main.py.
+
+    Commands across the CLI need the package name (src/<package>/main.py)
+    and previously each kept its own glob-based scan. One os.scandir pass
+    answers the question without allocating a Path per directory entry,
+    and the result is cached for the life of the process since the package
+    name cannot change mid-run.
+
+    Returns:
+        Package name if found, None if src/ is missing or holds no package
+    """
+    try:
+        with os.scandir("src") as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "main.py")):
+                    return entry.name
+    except FileNotFoundError:
+        return None
+    return None
+
+
+def write_bytes(path: Path | str, data: bytes) -> None:
+    """
+    Write a whole file with one low-level write call.
+
+    Generated files are small and written exactly once, so the buffered
+    text-I/O stack (TextIOWrapper + BufferedWriter) is pure setup overhead.
+    A raw os.open/os.write pair issues a single write syscall per file.
+
+    Args:
+        path: Destination file path
+        data: Complete file content as bytes
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _touch_new(path: Path) -> None:
+    """
+    Create an empty file only if it doesn't exist, in one syscall.
+
+    O_CREAT|O_EXCL makes the kernel do the existence check atomically, so
+    this replaces the stat from Path.exists() plus the buffered open/close
+    that Path.write_text would spend on a zero-byte payload.
+    """
+    try:
+        os.close(os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+    except FileExistsError:
+        pass
+
+
 def ensure_init_files(root: Path, rel_dirs: list[str]) -> None:
     """
     Ensure directories exist with proper Python package initialization.
@@ -55,12 +114,10 @@ def ensure_init_files(root: Path, rel_dirs: list[str]) -> None:
     for dir_path in rel_dirs:
         # Create the full directory path
         full_path = root / dir_path
-        full_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(full_path, exist_ok=True)
 
         # Ensure __init__.py exists in the target directory
-        init_file = full_path / "__init__.py"
-        if not init_file.exists():
-            init_file.write_text("", encoding="utf-8")
+        _touch_new(full_path / "__init__.py")
 
         # Also ensure all parent directories have __init__.py files
         _ensure_parent_init_files(root, full_path)
@@ -98,8 +155,6 @@ def _ensure_parent_init_files(root: Path, target_path: Path) -> None:
             break
 
         # Ensure parent directory has __init__.py
-        parent_init = parent_path / "__init__.py"
-        if not parent_init.exists():
-            parent_init.write_text("", encoding="utf-8")
+        _touch_new(parent_path / "__init__.py")
 
         current_path = parent_path